@@ -91,6 +91,7 @@ class DataCalcApp(BaseApp):
         """
         originalDBs = set(self.dbs)
         newDBs = set([""])
+        addingDBs = []
         for db in content.get("db", ()):
             if any(key not in db for key in ("name", "path")):
                 print(f"The message was ignored because "
@@ -100,16 +101,22 @@ class DataCalcApp(BaseApp):
             newDBs.add(name)
             if name not in self.dbs:
                 self.dbs[name] = path
-                for dbBox in self.viewerFrame.dbBoxes.values():
-                    dbBox.addItem(name)
+                addingDBs.append(name)
+        if addingDBs:
+            for dbBox in self.viewerFrame.dbBoxes.values():
+                dbBox.addItems(addingDBs)
         removingDBs = originalDBs - newDBs
         for dbBox in self.viewerFrame.dbBoxes.values():
             if dbBox.currentText() in removingDBs:
                 dbBox.setCurrentText("")
         for name in removingDBs:
             self.dbs.pop(name)
-            for dbBox in self.viewerFrame.dbBoxes.values():
+        for dbBox in self.viewerFrame.dbBoxes.values():
+            # removing items may shift the current index, but the current text is kept
+            blocked = dbBox.blockSignals(True)
+            for name in removingDBs:
                 dbBox.removeItem(dbBox.findText(name))
+            dbBox.blockSignals(blocked)
 
     def receivedSlot(self, channelName: str, content: Any):
         """Overridden.
@@ -3,9 +3,9 @@ App module for logging.
 """
 
 import time
-from typing import Any, Optional, Tuple
+from typing import Any, List, Optional, Tuple
 
-from PyQt5.QtCore import QObject, pyqtSlot, pyqtSignal
+from PyQt5.QtCore import QObject, pyqtSlot, pyqtSignal, QTimer
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QPushButton, QTextEdit, QLabel, QDialogButtonBox
 
 from qiwis import BaseApp
@@ -55,11 +55,13 @@ class ConfirmClearingFrame(QWidget):
         layout.addWidget(self.label)
         layout.addWidget(self.buttonBox)
 
+    @pyqtSlot()
     def buttonOKClicked(self):
         """Clicks OK to clear log."""
         self.confirmed.emit()
         self.close()
 
+    @pyqtSlot()
     def buttonCancelClicked(self):
         """Clicks Cancel not to clear log."""
         self.close()
@@ -69,9 +71,12 @@ class LoggerApp(BaseApp):
     """App for logging.
 
     Manages a logger frame.
+    The received logs are shown in batches, at most every 50ms,
+      so that the text edit is not re-laid out for every single log.
 
     Attributes:
         loggerFrame: A frame that shows the logs.
+        flushTimer: A single-shot QTimer for showing the pending logs.
     """
     def __init__(self, name: str, parent: Optional[QObject] = None):
         """Extended.
@@ -81,7 +86,14 @@ class LoggerApp(BaseApp):
         """
         super().__init__(name, parent=parent)
         self.loggerFrame = LoggerFrame()
+        self._pendingLogs: List[str] = []
+        self._timeSecond = None
+        self._timeString = ""
+        self.flushTimer = QTimer(self)
+        self.flushTimer.setSingleShot(True)
+        self.flushTimer.setInterval(50)
         # connect signals to slots
+        self.flushTimer.timeout.connect(self.flushLogs)
         self.loggerFrame.clearButton.clicked.connect(self.checkToClear)
         self.confirmFrame = ConfirmClearingFrame()
         self.confirmFrame.confirmed.connect(self.clearLog)
@@ -93,11 +105,24 @@ class LoggerApp(BaseApp):
     def addLog(self, content: str):
         """Adds a channel name and log message.
 
+        The log is shown when self.flushTimer times out.
+
         Args:
             content: Received log message.
         """
-        timeString = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(time.time()))
-        self.loggerFrame.logEdit.insertPlainText(f"{timeString}: {content}\n")
+        timeSecond = int(time.time())
+        if timeSecond != self._timeSecond:
+            self._timeSecond = timeSecond
+            self._timeString = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(timeSecond))
+        self._pendingLogs.append(f"{self._timeString}: {content}\n")
+        if not self.flushTimer.isActive():
+            self.flushTimer.start()
+
+    @pyqtSlot()
+    def flushLogs(self):
+        """Shows the pending logs in the log text edit at once."""
+        self.loggerFrame.logEdit.insertPlainText("".join(self._pendingLogs))
+        self._pendingLogs.clear()
 
     def receivedSlot(self, channelName: str, content: Any):
         """Overridden.
@@ -124,5 +149,7 @@ class LoggerApp(BaseApp):
 
     @pyqtSlot()
     def clearLog(self):
-        """Clears the log text edit."""
+        """Clears the log text edit and the pending logs."""
+        self.flushTimer.stop()
+        self._pendingLogs.clear()
         self.loggerFrame.logEdit.clear()
@@ -107,6 +107,7 @@ class NumGenApp(BaseApp):
         """
         originalDBs = set(self.dbs)
         newDBs = set([""])
+        addingDBs = []
         for db in content.get("db", ()):
             if any(key not in db for key in ("name", "path")):
                 print(f"The message was ignored because "
@@ -116,13 +117,18 @@ class NumGenApp(BaseApp):
             newDBs.add(name)
             if name not in self.dbs:
                 self.dbs[name] = path
-                self.generatorFrame.dbBox.addItem(name)
+                addingDBs.append(name)
+        if addingDBs:
+            self.generatorFrame.dbBox.addItems(addingDBs)
         removingDBs = originalDBs - newDBs
         if self.generatorFrame.dbBox.currentText() in removingDBs:
             self.generatorFrame.dbBox.setCurrentText("")
+        # removing items may shift the current index, but the current text is kept
+        blocked = self.generatorFrame.dbBox.blockSignals(True)
         for name in removingDBs:
             self.dbs.pop(name)
             self.generatorFrame.dbBox.removeItem(self.generatorFrame.dbBox.findText(name))
+        self.generatorFrame.dbBox.blockSignals(blocked)
 
     def receivedSlot(self, channelName: str, content: Any):
         """Overridden.
@@ -93,6 +93,7 @@ class PollerApp(BaseApp):
         """
         originalDBs = set(self.dbs)
         newDBs = set([""])
+        addingDBs = []
         for db in content.get("db", ()):
             if any(key not in db for key in ("name", "path")):
                 print(f"The message was ignored because "
@@ -102,13 +103,18 @@ class PollerApp(BaseApp):
             newDBs.add(name)
             if name not in self.dbs:
                 self.dbs[name] = path
-                self.viewerFrame.dbBox.addItem(name)
+                addingDBs.append(name)
+        if addingDBs:
+            self.viewerFrame.dbBox.addItems(addingDBs)
         removingDBs = originalDBs - newDBs
         if self.viewerFrame.dbBox.currentText() in removingDBs:
             self.viewerFrame.dbBox.setCurrentText("")
+        # removing items may shift the current index, but the current text is kept
+        blocked = self.viewerFrame.dbBox.blockSignals(True)
         for name in removingDBs:
             self.dbs.pop(name)
             self.viewerFrame.dbBox.removeItem(self.viewerFrame.dbBox.findText(name))
+        self.viewerFrame.dbBox.blockSignals(blocked)
 
     def receivedSlot(self, channelName: str, content: Any):
         """Overridden.
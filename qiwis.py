@@ -24,13 +24,19 @@ import os
 import sys
 from collections import defaultdict
 from contextlib import contextmanager
+from types import ModuleType
 from typing import (
-    Dict, DefaultDict, Set, Any, Callable, Iterable, Mapping, Optional, Tuple, TypeVar, Type
+    Dict, DefaultDict, Set, Any, Callable, Iterable, Mapping, Optional, Tuple, TypeVar, Type, Union
 )
 
 from PyQt5.QtCore import QObject, pyqtSignal, pyqtSlot, Qt
 from PyQt5.QtWidgets import QApplication, QMainWindow, QDockWidget, QMessageBox, QWidget
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 T = TypeVar("T")
 
@@ -38,6 +44,66 @@ T = TypeVar("T")
 logger = logging.getLogger(__name__)
 
 
+_DOCK_WIDGET_AREAS: Dict[str, Qt.DockWidgetArea] = {
+    "left": Qt.LeftDockWidgetArea,
+    "right": Qt.RightDockWidgetArea,
+    "top": Qt.TopDockWidgetArea,
+    "bottom": Qt.BottomDockWidgetArea
+}
+
+
+def _loads_json(s: Union[str, bytes]) -> Any:
+    """Returns the object decoded from a JSON document, using orjson if it is installed.
+
+    This is only for documents of known schemas, e.g., the setup file and
+      the Serializable objects, not for the arbitrary broadcast messages.
+    Whenever orjson rejects s, e.g., a document with NaN or Infinity,
+      it is decoded by json.loads() again, hence it succeeds or fails likewise.
+    The remaining difference with orjson is:
+      Integers beyond the 64-bit range are decoded as floats, not ints,
+      e.g., 123456789012345678901234567890 becomes 1.2345678901234568e+29.
+
+    Args:
+        s: A JSON document as a str or UTF-8 encoded bytes.
+
+    Raises:
+        json.JSONDecodeError: When s is not a valid JSON document.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(s)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(s)
+
+
+def _dumps_json(obj: Any) -> str:
+    """Returns a JSON string converted from obj, using orjson if it is installed.
+
+    Whenever orjson rejects obj, e.g., an integer beyond the 64-bit range,
+      a non-str dictionary key, a dataclass or a datetime object,
+      it is converted by json.dumps() again, hence it succeeds or fails likewise.
+    The remaining differences with orjson are:
+      NaN and infinite floats are converted to null, not NaN or Infinity.
+      uuid.UUID and enum.Enum objects are accepted, not rejected.
+
+    Args:
+        obj: A JSONifiable object.
+
+    Raises:
+        TypeError: When obj is not JSONifiable.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                obj,
+                option=orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_DATETIME,
+            ).decode()
+        except TypeError:  # orjson.JSONEncodeError is a subclass of TypeError
+            pass
+    return json.dumps(obj)
+
+
 class Serializable:  # pylint: disable=too-few-public-methods
     """A type for dataclasses that can be converted to a JSON string.
     
@@ -76,26 +142,31 @@ class AppInfo(Serializable):
     args: Optional[Mapping[str, Any]] = None
 
 
-def loads(cls: Type[T], kwargs: str) -> T:
+def loads(cls: Type[T], kwargs: Union[str, bytes]) -> T:
     """Returns a new cls instance from a JSON string.
     
     Args:
         cls: A class object.
         kwargs: A JSON string of a dictionary that contains the keyword arguments of cls.
+          It can also be given as UTF-8 encoded bytes.
           Positional arguments should be given with the argument names, just like
           the other keyword arguments.
           There must not exist arguments which are not in cls constructor.
     """
-    return cls(**json.loads(kwargs))
+    return cls(**_loads_json(kwargs))
 
 
 def dumps(obj: Serializable) -> str:
     """Returns a JSON string converted from the given Serializable object.
+
+    The exact string may differ, e.g., in whitespaces, depending on whether
+      orjson is installed. Compare the decoded objects, not the strings.
+    With orjson, NaN and infinite floats are converted to null; see _dumps_json().
     
     Args:
         obj: Dataclass object to convert to a JSON string.
     """
-    return json.dumps(dataclasses.asdict(obj))
+    return _dumps_json(dataclasses.asdict(obj))
 
 
 @dataclasses.dataclass
@@ -163,6 +234,7 @@ class Qiwis(QObject):
         self._dockWidgets = defaultdict(list)
         self._apps: Dict[str, BaseApp] = {}
         self._subscribers: DefaultDict[str, Set[str]] = defaultdict(set)
+        self._receivedEmitters: Dict[str, Tuple[Callable[[str, str], None], ...]] = {}
         appInfos = appInfos if appInfos else {}
         self.load(appInfos)
         self.mainWindow.show()
@@ -192,12 +264,7 @@ class Qiwis(QObject):
         """
         dockWidget = QDockWidget(name, self.mainWindow)
         dockWidget.setWidget(frame)
-        area = {
-            "left": Qt.LeftDockWidgetArea,
-            "right": Qt.RightDockWidgetArea,
-            "top": Qt.TopDockWidgetArea,
-            "bottom": Qt.BottomDockWidgetArea
-        }.get(info.pos, Qt.LeftDockWidgetArea)
+        area = _DOCK_WIDGET_AREAS.get(info.pos, Qt.LeftDockWidgetArea)
         if info.show:
             self.mainWindow.addDockWidget(area, dockWidget)
         self._dockWidgets[name].append(dockWidget)
@@ -229,8 +296,7 @@ class Qiwis(QObject):
             name: A name of app.
             info: An AppInfo object describing the app.
         """
-        with _add_to_path(os.path.dirname(info.path)):
-            module = importlib.import_module(info.module)
+        module = _import_module(os.path.abspath(os.path.dirname(info.path)), info.module)
         cls = getattr(module, info.cls)
         if info.args is not None:
             app = cls(name, parent=self, **info.args)
@@ -246,6 +312,9 @@ class Qiwis(QObject):
         for frame in app.frames():
             self.addFrame(name, frame, info)
         self._apps[name] = app
+        for channel, apps in self._subscribers.items():
+            if name in apps:
+                self._receivedEmitters.pop(channel, None)
         logger.info("Created an app %s: %s", name, info)
 
     def destroyApp(self, name: str):
@@ -258,8 +327,10 @@ class Qiwis(QObject):
         for dockWidget in dockWidgets:
             self.removeFrame(name, dockWidget)
         del self._dockWidgets[name]
-        for apps in self._subscribers.values():
-            apps.discard(name)
+        for channel, apps in self._subscribers.items():
+            if name in apps:
+                apps.remove(name)
+                self._receivedEmitters.pop(channel, None)
         self._apps.pop(name).deleteLater()
         logger.info("Destroyed the app %s", name)
 
@@ -305,6 +376,7 @@ class Qiwis(QObject):
             logger.warning("The app %s already subscribes to %s", app, channel)
         else:
             self._subscribers[channel].add(app)
+            self._receivedEmitters.pop(channel, None)
             logger.info("The app %s now subscribes to %s", app, channel)
 
     def unsubscribe(self, app: str, channel: str) -> bool:
@@ -324,6 +396,7 @@ class Qiwis(QObject):
             logger.error("The app %s tried to unsubscribe from %s, "
                          "which it does not subscribe to", app, channel)
             return False
+        self._receivedEmitters.pop(channel, None)
         logger.info("The app %s unsubscribed from %s", app, channel)
         return True
 
@@ -335,8 +408,14 @@ class Qiwis(QObject):
             channelName: Target channel name.
             msg: Message to be broadcast.
         """
-        for name in self._subscribers[channelName]:
-            self._apps[name].received.emit(channelName, msg)
+        emitters = self._receivedEmitters.get(channelName)
+        if emitters is None:
+            emitters = tuple(
+                self._apps[name].received.emit for name in self._subscribers[channelName]
+            )
+            self._receivedEmitters[channelName] = emitters
+        for emit in emitters:
+            emit(channelName, msg)
 
     def _parseArgs(self, call: Callable, args: Mapping[str, Any]) -> Dict[str, Any]:
         """Converts all Serializable arguments to dataclass objects from strings.
@@ -619,14 +698,29 @@ def _add_to_path(path: str):
         path: A desired path to be added. 
     """
     old_path = sys.path
-    sys.path = old_path.copy()
-    sys.path.insert(0, path)
+    sys.path = [path, *old_path]
     try:
         yield
     finally:
         sys.path = old_path
 
 
+@functools.lru_cache(maxsize=128)
+def _import_module(path: str, name: str) -> ModuleType:
+    """Imports a module with the path added temporarily.
+
+    The imported module is cached by the arguments, hence importing the same module
+    again, e.g., re-creating an app by a qiwiscall, is only a dictionary lookup.
+
+    Args:
+        path: A path to be added while importing. It should be an absolute path,
+          otherwise the cached module may not correspond to the current directory.
+        name: A module name to import.
+    """
+    with _add_to_path(path):
+        return importlib.import_module(name)
+
+
 def _get_argparser() -> argparse.ArgumentParser:
     """Parses command line arguments.
 
@@ -665,8 +759,8 @@ def _read_setup_file(setup_path: str) -> Mapping[str, AppInfo]:
     Returns:
         A dictionary of set-up information about apps. See appInfos in Qiwis.load().
     """
-    with open(setup_path, encoding="utf-8") as setup_file:
-        setup_data: Dict[str, Dict[str, dict]] = json.load(setup_file)
+    with open(setup_path, "rb") as setup_file:
+        setup_data: Dict[str, Dict[str, dict]] = _loads_json(setup_file.read())
     app_dict = setup_data.get("app", {})
     app_infos = {name: AppInfo(**info) for (name, info) in app_dict.items()}
     logger.info("Loaded %d app infos from %s", len(app_infos), setup_path)
@@ -2,11 +2,12 @@
 Module for testing qiwis module.
 """
 
-import collections.abc
 import dataclasses
 import sys
 import json
+import math
 import unittest
+from types import MappingProxyType
 from unittest import mock
 from typing import Any, Optional, Mapping, Iterable
 
@@ -15,7 +16,7 @@ from PyQt5.QtWidgets import QApplication, QMessageBox, QWidget
 
 import qiwis
 
-APP_INFOS = {
+APP_INFOS = MappingProxyType({
     "app1": qiwis.AppInfo(
         module="module1",
         cls="cls1",
@@ -29,9 +30,9 @@ APP_INFOS = {
         module="module2",
         cls="cls2"
     )
-}
+})
 
-APP_DICTS = {
+APP_DICTS = MappingProxyType({
     "app1": {
         "module": "module1",
         "cls": "cls1",
@@ -45,39 +46,70 @@ APP_DICTS = {
         "module": "module2",
         "cls": "cls2"
     }
-}
+})
 
-APP_JSONS = {
-    "app1": ('{"module": "module1", "cls": "cls1", "path": "path1", "show": false, '
-             '"pos": "left", "channel": ["ch1", "ch2"], "args": {"arg1": "value1"}}'),
-    "app2": ('{"module": "module2", "cls": "cls2", "path": ".", "show": true, '
-             '"pos": "", "channel": [], "args": null}'),
-    "app2_default": '{"module": "module2", "cls": "cls2"}'
-}
+APP_JSONS = MappingProxyType({
+    "app1": (b'{"module": "module1", "cls": "cls1", "path": "path1", "show": false, '
+             b'"pos": "left", "channel": ["ch1", "ch2"], "args": {"arg1": "value1"}}'),
+    "app2": (b'{"module": "module2", "cls": "cls2", "path": ".", "show": true, '
+             b'"pos": "", "channel": [], "args": null}'),
+    "app2_default": b'{"module": "module2", "cls": "cls2"}'
+})
 
+CHANNELS = {channel for appInfo in APP_INFOS.values() for channel in appInfo.channel}
 
-qapp = QApplication(sys.argv)
 
+qapp = QApplication.instance() or QApplication(sys.argv)
 
-class QiwisTestWithApps(unittest.TestCase):
-    """Unit test for Qiwis class with creating apps."""
 
-    def setUp(self):
-        self.import_module_patcher = mock.patch("importlib.import_module")
-        self.mocked_import_module = self.import_module_patcher.start()
+class QiwisTestWithAppsBase(unittest.TestCase):
+    """Base class of unit tests for Qiwis class with creating apps.
+
+    importlib.import_module is patched for the whole class, so that the apps
+    in APP_INFOS are created as mocked objects.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.import_module_patcher = mock.patch("importlib.import_module")
+        cls.mocked_import_module = cls.import_module_patcher.start()
+        cls.mocked_apps = []
         for appInfo in APP_INFOS.values():
-            app_ = mock.MagicMock()
+            app_ = mock.MagicMock(spec=qiwis.BaseApp)
             app_.cls = appInfo.cls
+            setattr(cls.mocked_import_module.return_value, appInfo.cls,
+                    mock.MagicMock(return_value=app_))
+            cls.mocked_apps.append(app_)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.import_module_patcher.stop()
+
+    @classmethod
+    def createQiwis(cls) -> qiwis.Qiwis:
+        """Returns a new Qiwis object created with APP_INFOS and the reset mocks."""
+        qiwis._import_module.cache_clear()
+        cls.mocked_import_module.reset_mock()
+        for app_ in cls.mocked_apps:
             app_.frames.return_value = (QWidget(),)
-            cls = mock.MagicMock(return_value=app_)
-            setattr(self.mocked_import_module.return_value, appInfo.cls, cls)
-        self.channels = set()
-        for appInfo in APP_INFOS.values():
-            self.channels.update(appInfo.channel)
-        self.qiwis = qiwis.Qiwis(APP_INFOS)
+            app_.received.reset_mock()
+        return qiwis.Qiwis(APP_INFOS)
+
+
+class QiwisReadOnlyTestWithApps(QiwisTestWithAppsBase):
+    """Unit test for Qiwis class with creating apps, which does not modify the apps.
+
+    The tests share a single Qiwis object created once in setUpClass().
+    """
 
-    def doCleanups(self):
-        self.import_module_patcher.stop()
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.qiwis = cls.createQiwis()
+
+    def setUp(self):
+        for app_ in self.mocked_apps:
+            app_.received.reset_mock()
 
     def test_init(self):
         self.assertEqual(self.qiwis.appInfos, APP_INFOS)
@@ -85,15 +117,42 @@ class QiwisTestWithApps(unittest.TestCase):
             self.mocked_import_module.assert_any_call(info.module)
             self.assertEqual(self.qiwis._apps[name].cls, info.cls)
             self.assertIn(name, self.qiwis._dockWidgets)
-        for channel in self.channels:
+        for channel in CHANNELS:
             self.assertIn(channel, self.qiwis._subscribers)
 
     def test_app_names(self):
         appNamesSet = set(self.qiwis.appNames())
         self.assertEqual(appNamesSet, set(APP_INFOS))
 
+    def test_channel_names(self):
+        channelNamesSet = set(self.qiwis.channelNames())
+        self.assertEqual(channelNamesSet, CHANNELS)
+
+    def test_subscriber_names(self):
+        for channel in CHANNELS:
+            subscriberNamesSet = set(self.qiwis.subscriberNames(channel))
+            self.assertEqual(
+                subscriberNamesSet,
+                {name for name, info in APP_INFOS.items() if channel in info.channel}
+            )
+
+    def test_broadcast(self):
+        for channelName in CHANNELS:
+            self.qiwis._broadcast(channelName, "test_msg")
+        self.assertEqual(
+            {name: len(info.channel) for name, info in APP_INFOS.items()},
+            {name: app_.received.emit.call_count for name, app_ in self.qiwis._apps.items()},
+        )
+
+
+class QiwisTestWithApps(QiwisTestWithAppsBase):
+    """Unit test for Qiwis class with creating apps, which may modify the apps."""
+
+    def setUp(self):
+        self.qiwis = self.createQiwis()
+
     def test_create_app(self):
-        app_ = mock.MagicMock()
+        app_ = mock.MagicMock(spec=qiwis.BaseApp)
         app_.cls = "cls3"
         app_.frames.return_value = (QWidget(),)
         cls = mock.MagicMock(return_value=app_)
@@ -134,28 +193,38 @@ class QiwisTestWithApps(unittest.TestCase):
         self.assertFalse(finalFramesSet & orgFramesSet)
         self.assertEqual(finalFramesSet, newFramesSet)
 
-    def test_channel_names(self):
-        channelNamesSet = set(self.qiwis.channelNames())
-        self.assertEqual(channelNamesSet, self.channels)
-
-    def test_subscriber_names(self):
-        for channel in self.channels:
-            subscriberNamesSet = set(self.qiwis.subscriberNames(channel))
-            self.assertEqual(
-                subscriberNamesSet,
-                {name for name, info in APP_INFOS.items() if channel in info.channel}
-            )
-
     def test_unsubcribe(self):
         self.assertEqual(self.qiwis.unsubscribe("app1", "ch1"), True)
         self.assertNotIn("app1", self.qiwis._subscribers["ch1"])
         self.assertEqual(self.qiwis.unsubscribe("app2", "ch1"), False)
 
-    def test_broadcast(self):
-        for channelName in self.channels:
-            self.qiwis._broadcast(channelName, "test_msg")
-        for name, app_ in self.qiwis._apps.items():
-            self.assertEqual(len(APP_INFOS[name].channel), app_.received.emit.call_count)
+    def test_broadcast_after_unsubscribe(self):
+        self.qiwis._broadcast("ch1", "test_msg")
+        self.qiwis.unsubscribe("app1", "ch1")
+        self.qiwis._broadcast("ch1", "test_msg")
+        self.qiwis.subscribe("app2", "ch1")
+        self.qiwis._broadcast("ch1", "test_msg")
+        self.assertEqual(self.qiwis._apps["app1"].received.emit.call_count, 1)
+        self.assertEqual(self.qiwis._apps["app2"].received.emit.call_count, 1)
+
+    def test_broadcast_after_recreate_app(self):
+        """Tests for the case where an app is created again with an existing name."""
+        orgApp = self.qiwis._apps["app1"]
+        self.qiwis._broadcast("ch1", "test_msg")
+        newApp = mock.MagicMock(spec=qiwis.BaseApp)
+        newApp.frames.return_value = (QWidget(),)
+        setattr(self.mocked_import_module.return_value, "cls3", mock.MagicMock(return_value=newApp))
+        self.qiwis.createApp("app1", qiwis.AppInfo(module="module3", cls="cls3", channel=["ch1"]))
+        self.qiwis._broadcast("ch1", "test_msg")
+        self.assertEqual(orgApp.received.emit.call_count, 1)
+        self.assertEqual(newApp.received.emit.call_count, 1)
+
+    def test_broadcast_after_destroy_app(self):
+        app_ = self.qiwis._apps["app1"]
+        self.qiwis._broadcast("ch1", "test_msg")
+        self.qiwis.destroyApp("app1")
+        self.qiwis._broadcast("ch1", "test_msg")
+        self.assertEqual(app_.received.emit.call_count, 1)
 
 
 class QiwisTestWithoutApps(unittest.TestCase):
@@ -342,13 +411,37 @@ class BaseAppTest(unittest.TestCase):
         qiwis.BaseApp("name", QObject())
 
     def test_frames(self):
-        self.assertIsInstance(self.app.frames(), collections.abc.Iterable)
+        iter(self.app.frames())  # raises TypeError if it is not iterable
 
     def test_broadcast(self):
         self.app.broadcastRequested = mock.MagicMock()
         self.app.broadcast("ch1", "msg")
         self.app.broadcastRequested.emit.assert_called_once_with("ch1", '"msg"')
 
+    def test_broadcast_json_compatible(self):
+        content = {"big": 2 ** 70, 1: "non-str key"}
+        self.app.broadcastRequested = mock.MagicMock()
+        self.app.broadcast("ch1", content)
+        self.app.broadcastRequested.emit.assert_called_once_with("ch1", json.dumps(content))
+
+    def test_broadcast_non_finite(self):
+        """NaN and infinite floats are received as they are, whether orjson is installed or not."""
+        self.app.broadcastRequested = mock.MagicMock()
+        self.app.receivedSlot = mock.MagicMock()
+        self.app.broadcast("ch1", [math.nan, math.inf, 1.5])
+        self.app._receivedMessage(*self.app.broadcastRequested.emit.call_args[0])
+        _, content = self.app.receivedSlot.call_args[0]
+        self.assertTrue(math.isnan(content[0]))
+        self.assertEqual(content[1:], [math.inf, 1.5])
+
+    def test_broadcast_dataclass_exception(self):
+        @dataclasses.dataclass
+        class ClassForTest:
+            a: int
+        self.app.broadcastRequested = mock.MagicMock()
+        self.app.broadcast("ch1", ClassForTest(a=1))
+        self.app.broadcastRequested.emit.assert_not_called()
+
     def test_broadcast_exception(self):
         self.app.broadcastRequested = mock.MagicMock()
         self.app.broadcast("ch1", lambda: None)
@@ -359,6 +452,19 @@ class BaseAppTest(unittest.TestCase):
         self.app._receivedMessage("ch1", '"msg"')
         self.app.receivedSlot.assert_called_once_with("ch1", "msg")
 
+    def test_received_message_non_finite(self):
+        self.app.receivedSlot = mock.MagicMock()
+        self.app._receivedMessage("ch1", "[NaN, Infinity]")
+        self.app.receivedSlot.assert_called_once()
+        _, content = self.app.receivedSlot.call_args[0]
+        self.assertTrue(math.isnan(content[0]))
+        self.assertEqual(content[1], math.inf)
+
+    def test_received_message_big_integer(self):
+        self.app.receivedSlot = mock.MagicMock()
+        self.app._receivedMessage("ch1", "123456789012345678901234567890")
+        self.app.receivedSlot.assert_called_once_with("ch1", 123456789012345678901234567890)
+
     def test_received_message_exception(self):
         self.app.receivedSlot = mock.MagicMock()
         self.app._receivedMessage("ch1", '"msg1" "msg2"')
@@ -490,20 +596,45 @@ class QiwisFunctionTest(unittest.TestCase):
     """Unit test for functions."""
 
     def test_loads(self):
-        self.assertEqual(qiwis.loads(qiwis.AppInfo, APP_JSONS["app1"]), APP_INFOS["app1"])
-        self.assertEqual(qiwis.loads(qiwis.AppInfo, APP_JSONS["app2_default"]), APP_INFOS["app2"])
+        for jsonKey, infoKey in (("app1", "app1"), ("app2_default", "app2")):
+            for kwargs in (APP_JSONS[jsonKey], APP_JSONS[jsonKey].decode()):
+                with self.subTest(json=jsonKey, type=type(kwargs)):
+                    info = qiwis.loads(qiwis.AppInfo, kwargs)
+                    self.assertEqual(info, APP_INFOS[infoKey])
 
     def test_dumps(self):
-        self.assertEqual(qiwis.dumps(APP_INFOS["app1"]), APP_JSONS["app1"])
-        self.assertEqual(qiwis.dumps(APP_INFOS["app2"]), APP_JSONS["app2"])
+        for key in ("app1", "app2"):
+            with self.subTest(info=key):
+                dumped = qiwis.dumps(APP_INFOS[key])
+                self.assertEqual(json.loads(dumped), json.loads(APP_JSONS[key]))
+
+    def test_dumps_loads_round_trip(self):
+        """Every field is kept, including underscored ones, but not other attributes."""
+        @dataclasses.dataclass
+        class ClassForTest(qiwis.Serializable):
+            a: int
+            _b: int = 2
+        obj = ClassForTest(a=1, _b=5)
+        obj.cache = 1  # pylint: disable=attribute-defined-outside-init
+        self.assertEqual(qiwis.loads(ClassForTest, qiwis.dumps(obj)), ClassForTest(a=1, _b=5))
 
     def test_add_to_path(self):
         test_dir = "/test_dir"
-        old_path = sys.path.copy()
+        old_path = sys.path
+        old_len = len(old_path)
         with qiwis._add_to_path(test_dir):
-            self.assertNotEqual(old_path, sys.path)
-            self.assertIn(test_dir, sys.path)
-        self.assertEqual(old_path, sys.path)
+            self.assertEqual(len(sys.path), old_len + 1)
+            self.assertEqual(sys.path[0], test_dir)
+        self.assertIs(sys.path, old_path)
+        self.assertEqual(len(sys.path), old_len)
+
+    @mock.patch("importlib.import_module")
+    def test_import_module(self, mock_import_module):
+        qiwis._import_module.cache_clear()
+        module = qiwis._import_module("/test_dir", "module")
+        self.assertIs(qiwis._import_module("/test_dir", "module"), module)
+        mock_import_module.assert_called_once_with("module")
+        qiwis._import_module.cache_clear()
 
     @mock.patch.object(sys, "argv", ["", "-s", "test_setup.json"])
     def test_get_argparser(self):
@@ -517,22 +648,22 @@ class QiwisFunctionTest(unittest.TestCase):
         self.assertEqual(args.setup_path, "./setup.json")
 
     @mock.patch("builtins.open")
-    @mock.patch("json.load", return_value={"app": APP_DICTS})
+    @mock.patch("qiwis._loads_json", return_value={"app": APP_DICTS})
     def test_read_setup_file(self, mock_load, mock_open):
         self.assertEqual(qiwis._read_setup_file(""), APP_INFOS)
         mock_open.assert_called_once()
         mock_load.assert_called_once()
 
-    @mock.patch("qiwis._get_argparser")
-    @mock.patch("qiwis._read_setup_file", return_value={})
-    @mock.patch("qiwis.Qiwis")
-    @mock.patch("qiwis.QApplication")
-    def test_main(self, mock_qapp, mock_qiwis, mock_read_setup_file, mock_get_argparser):
-        qiwis.main()
-        mock_get_argparser.assert_called_once()
-        mock_read_setup_file.assert_called_once()
-        mock_qiwis.assert_called_once()
-        mock_qapp.return_value.exec_.assert_called_once()
+    def test_main(self):
+        with mock.patch.multiple("qiwis", _get_argparser=mock.DEFAULT,
+                                 _read_setup_file=mock.DEFAULT,
+                                 Qiwis=mock.DEFAULT, QApplication=mock.DEFAULT) as mocked:
+            mocked["_read_setup_file"].return_value = {}
+            qiwis.main()
+        mocked["_get_argparser"].assert_called_once()
+        mocked["_read_setup_file"].assert_called_once()
+        mocked["Qiwis"].assert_called_once_with({})
+        mocked["QApplication"].return_value.exec_.assert_called_once()
 
 
 if __name__ == "__main__":